@@ -8,8 +8,17 @@ Standalone hash function library - no chaincode dependencies.
 from .cellular_automaton import (
     TrafficAdaptiveCA,
     traffic_adaptive_hash,
+    traffic_adaptive_hash_bytes,
+    traffic_adaptive_hash_stream,
+    traffic_adaptive_hash_batch,
+    traffic_adaptive_hash_batch_bytes,
+    preferred_batch_size,
+    traffic_sha256_hash,
+    traffic_sha256_hash_bytes,
     intersection_hash,
     block_hash_with_traffic,
+    block_prefix,
+    block_hash_mine,
     verify_different_inputs
 )
 
@@ -19,20 +28,31 @@ from .hash_analysis import (
     bit_distribution_test,
     compare_rules,
     mining_simulation,
+    block_mining_simulation,
     generate_full_report
 )
 
 __all__ = [
     'TrafficAdaptiveCA',
     'traffic_adaptive_hash',
+    'traffic_adaptive_hash_bytes',
+    'traffic_adaptive_hash_stream',
+    'traffic_adaptive_hash_batch',
+    'traffic_adaptive_hash_batch_bytes',
+    'preferred_batch_size',
+    'traffic_sha256_hash',
+    'traffic_sha256_hash_bytes',
     'intersection_hash',
     'block_hash_with_traffic',
+    'block_prefix',
+    'block_hash_mine',
     'verify_different_inputs',
     'benchmark_hash',
     'avalanche_test',
     'bit_distribution_test',
     'compare_rules',
     'mining_simulation',
+    'block_mining_simulation',
     'generate_full_report'
 ]
 
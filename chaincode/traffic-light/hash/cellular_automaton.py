@@ -9,10 +9,64 @@ Innovation: Rule dynamically adapts based on traffic conditions
 """
 
 import hashlib
+import re
+import struct
 import time
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import numpy as np
+except ImportError:  # Optional: batch hashing falls back to one input at a time
+    np = None
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # Optional: fall back to pure-Python / numpy evolution
+    njit = None
+
+try:
+    from numba import cuda
+except ImportError:  # Optional: batches only run on the CPU
+    cuda = None
+
+# Byte codes of signal states in serialized intersection data
+SIGNAL_CODES = {"RED": 0, "YELLOW": 1, "GREEN": 2, "EMERGENCY": 3}
+
+# Traffic-aware rule selection, by (signal state, density bin)
+_RULE_TABLE = {
+    # Low traffic - chaotic rule for randomness on GREEN, simple XOR otherwise
+    ("GREEN", 0): 30,
+    ("YELLOW", 0): 90,
+    ("RED", 0): 90,
+    # Medium traffic - balanced complexity, Turing-complete rule on YELLOW
+    ("GREEN", 1): 90,
+    ("YELLOW", 1): 110,
+    ("RED", 1): 90,
+    # High traffic - controlled evolution on RED, traffic flow otherwise
+    ("GREEN", 2): 184,
+    ("YELLOW", 2): 184,
+    ("RED", 2): 110,
+    # Emergency override - Rule 184 simulates traffic flow
+    ("EMERGENCY", 0): 184,
+    ("EMERGENCY", 1): 184,
+    ("EMERGENCY", 2): 184,
+}
+_DEFAULT_RULES = (90, 90, 184)  # Other signal states, by density bin
+
+# Neighborhood radius by signal state (wider = more coordination)
+_NEIGHBORHOOD_RADIUS = {"GREEN": 1, "YELLOW": 2, "RED": 3, "EMERGENCY": 5}
+
+
+def _density_bin(density: float) -> int:
+    """Density bin: 0 = low (< 0.3), 1 = medium (< 0.7), 2 = high"""
+    if density < 0.3:
+        return 0
+    if density < 0.7:
+        return 1
+    return 2
+
 
 class TrafficAdaptiveCA:
     """
@@ -32,11 +86,11 @@ class TrafficAdaptiveCA:
             size: Number of cells in the automaton (default 256 for 256-bit hash)
         """
         self.size = size
-        self.state = [0] * size
+        self.state = 0  # All cells packed in one int, cell 0 = most significant bit
         self.rule = 30  # Default, will be adapted
         self.neighborhood_radius = 1  # Will adapt based on traffic
         
-    def init_state(self, data: bytes, traffic_density: float = 0.5) -> None:
+    def init_state(self, data: bytes, traffic_density: float = 0.5, pad_ctx=None) -> None:
         """
         Initialize CA state from input data + traffic density
         
@@ -45,29 +99,45 @@ class TrafficAdaptiveCA:
         Args:
             data: Input data bytes
             traffic_density: Traffic density (0.0 = empty, 1.0 = congested)
+            pad_ctx: Optional hashlib.sha256 object that already absorbed `data`
+                (see seed_bytes)
+        """
+        num_bytes = (self.size + 7) // 8
+        
+        # Keep only the first `size` bits
+        seed = self.seed_bytes(data, traffic_density, pad_ctx)
+        self.state = int.from_bytes(seed, 'big') >> (num_bytes * 8 - self.size)
+    
+    def seed_bytes(self, data: bytes, traffic_density: float = 0.5, pad_ctx=None) -> bytes:
         """
-        # Convert bytes to bits
-        bits = []
-        for byte in data:
-            for i in range(8):
-                bits.append((byte >> (7 - i)) & 1)
+        Initial state as bytes: input data, then traffic-aware padding
+        
+        Args:
+            data: Input data bytes
+            traffic_density: Traffic density (0.0 = empty, 1.0 = congested)
+            pad_ctx: Optional hashlib.sha256 object that already absorbed `data`,
+                so a shared prefix is not rehashed (it is updated in place,
+                pass a copy)
+        
+        Returns:
+            ceil(size / 8) bytes, most significant bit = cell 0
+        """
+        num_bytes = (self.size + 7) // 8
         
         # Traffic-aware padding: Higher density = more complex pattern
-        if len(bits) < self.size:
+        if len(data) * 8 < self.size:
             # Use traffic density to create unique padding
             density_seed = int(traffic_density * 255)
-            pad_generator = hashlib.sha256(data + bytes([density_seed]))
-            
-            pad_bits = []
-            for byte in pad_generator.digest():
-                for i in range(8):
-                    pad_bits.append((byte >> (7 - i)) & 1)
+            if pad_ctx is None:
+                pad_ctx = hashlib.sha256(data)
+            pad_ctx.update(bytes([density_seed]))
+            pad_bytes = pad_ctx.digest()
             
             # Repeat padding to fill state
-            needed = self.size - len(bits)
-            bits.extend((pad_bits * (needed // len(pad_bits) + 1))[:needed])
+            needed = num_bytes - len(data)
+            return data + (pad_bytes * (needed // len(pad_bytes) + 1))[:needed]
         
-        self.state = bits[:self.size]
+        return data[:num_bytes]
     
     def select_traffic_rule(self, density: float, signal_state: str) -> int:
         """
@@ -88,31 +158,8 @@ class TrafficAdaptiveCA:
         Returns:
             CA rule number (0-255)
         """
-        # Emergency override
-        if signal_state == "EMERGENCY":
-            return 184  # Rule 184 simulates traffic flow
-        
-        # Density-based rule selection
-        if density < 0.3:
-            # Low traffic - use chaotic rule for randomness
-            if signal_state == "GREEN":
-                return 30  # Rule 30: chaotic, good mixing
-            else:
-                return 90  # Rule 90: simple XOR
-        
-        elif density < 0.7:
-            # Medium traffic - balanced complexity
-            if signal_state == "YELLOW":
-                return 110  # Rule 110: Turing-complete
-            else:
-                return 90  # Rule 90: deterministic
-        
-        else:
-            # High traffic - controlled evolution
-            if signal_state == "RED":
-                return 110  # Rule 110: complex but controlled
-            else:
-                return 184  # Rule 184: traffic flow simulation
+        level = _density_bin(density)
+        return _RULE_TABLE.get((signal_state, level), _DEFAULT_RULES[level])
     
     def adapt_neighborhood(self, signal_state: str) -> int:
         """
@@ -133,16 +180,7 @@ class TrafficAdaptiveCA:
         Returns:
             Neighborhood radius (number of cells on each side)
         """
-        if signal_state == "GREEN":
-            return 1  # Local only
-        elif signal_state == "YELLOW":
-            return 2  # Medium coordination
-        elif signal_state == "RED":
-            return 3  # Wide area
-        elif signal_state == "EMERGENCY":
-            return 5  # Maximum coordination
-        else:
-            return 1  # Default
+        return _NEIGHBORHOOD_RADIUS.get(signal_state, 1)  # Default: local only
     
     def evolve(self, rule: int, radius: int = 1) -> None:
         """
@@ -155,36 +193,46 @@ class TrafficAdaptiveCA:
         2. Calculate neighborhood configuration
         3. Apply rule to determine new state
         
+        All cells are updated at once with bitwise operations on the packed
+        state: each neighbor is a rotated copy of the whole row.
+        
         Args:
             rule: CA rule number (0-255)
             radius: Neighborhood radius (1, 2, 3, etc.)
         """
-        new_state = [0] * self.size
-        
-        for i in range(self.size):
-            # Get extended neighborhood
-            neighborhood_bits = []
-            for offset in range(-radius, radius + 1):
-                idx = (i + offset) % self.size
-                neighborhood_bits.append(self.state[idx])
-            
-            # Calculate neighborhood configuration
-            neighborhood_value = 0
-            for bit in neighborhood_bits:
-                neighborhood_value = (neighborhood_value << 1) | bit
-            
-            # Apply rule
-            if radius == 1:
-                # Standard rule application for 3-cell neighborhood
-                new_state[i] = (rule >> neighborhood_value) & 1
-            else:
-                # Extended neighborhood: use hash-based rule
-                # Mix rule number with neighborhood value for larger neighborhoods
-                extended_rule = (rule ^ (neighborhood_value % 256))
-                bit_position = neighborhood_value % 8
-                new_state[i] = (extended_rule >> bit_position) & 1
+        self.state = _specialized_step(rule, radius, self.size)(self.state)
+    
+    def evolve_steps(self, rule: int, radius: int, steps: int) -> None:
+        """
+        Apply `steps` evolutions with the same rule and radius
+        
+        Radius-1 rules run the step function specialized to (rule, radius):
+        a few bitwise operations on the packed row beat converting it to
+        cells for the kernel. Wider neighborhoods use the compiled Numba
+        kernel when available. Both produce the same state.
         
-        self.state = new_state
+        Args:
+            rule: CA rule number (0-255)
+            radius: Neighborhood radius (1, 2, 3, etc.)
+            steps: Number of evolution steps
+        """
+        if _evolve_numba is None or radius == 1:
+            step = _specialized_step(rule, radius, self.size)
+            state = self.state
+            for _ in range(steps):
+                state = step(state)
+            self.state = state
+            return
+        
+        # Unpack to one uint8 per cell (padded to a whole number of bytes)
+        num_bytes = (self.size + 7) // 8
+        extra_bits = num_bytes * 8 - self.size
+        packed = np.frombuffer((self.state << extra_bits).to_bytes(num_bytes, 'big'), dtype=np.uint8)
+        cells = np.unpackbits(packed)[:self.size]
+        
+        cells = _evolve_numba(cells, rule, radius, steps)
+        
+        self.state = int.from_bytes(np.packbits(cells).tobytes(), 'big') >> extra_bits
     
     def calculate_evolution_steps(self, density: float, urgency: int = 0) -> int:
         """
@@ -221,18 +269,385 @@ class TrafficAdaptiveCA:
         Returns:
             32 bytes (256 bits) representing the hash
         """
-        # Convert state bits to bytes
-        hash_bytes = bytearray(32)  # 256 bits = 32 bytes
+        # Align the first 256 cells to the 256-bit hash (zero-filled if smaller)
+        if self.size >= 256:
+            hash_value = self.state >> (self.size - 256)
+        else:
+            hash_value = self.state << (256 - self.size)
         
-        for i in range(32):
-            byte_val = 0
-            for j in range(8):
-                bit_idx = i * 8 + j
-                if bit_idx < len(self.state):
-                    byte_val |= self.state[bit_idx] << (7 - j)
-            hash_bytes[i] = byte_val
+        return hash_value.to_bytes(32, 'big')
+
+
+# Minimal Boolean form of the radius-1 rules picked by select_traffic_rule(),
+# over the left (L), center (C) and right (R) neighbors
+_STEP_EXPRS = {
+    30: "L ^ (C | R)",
+    90: "L ^ R",
+    110: "(C | R) ^ (L & C & R)",
+    184: "(L & ~C) | (C & R)",  # Traffic flow: a car moves right if the cell ahead is free
+}
+
+
+@lru_cache(maxsize=None)
+def _specialized_step(rule: int, radius: int, size: int) -> Callable[[int], int]:
+    """
+    Generate a packed-int step function specialized to (rule, radius, size)
+    
+    The rule terms, rotation amounts and mask are inlined as constants, so
+    the generated function has no loops, branches or lookups. Compiled once
+    per combination and cached.
+    
+    Args:
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius (1, 2, 3, etc.)
+        size: Number of cells
+    
+    Returns:
+        Function mapping a packed state to the next packed state
+    """
+    mask = (1 << size) - 1
+    
+    def rotate(offset: int) -> str:
+        """Packed state rotated so cell i holds cell i + offset"""
+        shift = offset % size
+        if shift == 0:
+            return "s"
+        return f"((s << {shift}) | (s >> {size - shift})) & {mask}"
+    
+    return _generate_step(rule, radius, "s", rotate, str(mask))
+
+
+@lru_cache(maxsize=None)
+def _lane_step(rule: int, radius: int) -> Callable[[Callable[[int], Any], Any], Any]:
+    """
+    Generate a step function on a bit-sliced state
+    
+    Same rule terms as _specialized_step(), for anything supporting &, |
+    and ^, e.g. a uint64 array holding one cell of 64 independent replicas
+    per word (see traffic_adaptive_hash_batch_bytes).
+    
+    Args:
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius (1, 2, 3, etc.)
+    
+    Returns:
+        Function (neighbor, mask) -> next state, where neighbor(offset)
+        returns the state shifted so cell i holds cell i + offset and mask
+        is the all-ones value of the same width
+    """
+    return _generate_step(rule, radius, "neighbor, mask", lambda offset: f"neighbor({offset})", "mask")
+
+
+def _generate_step(
+    rule: int,
+    radius: int,
+    params: str,
+    fetch: Callable[[int], str],
+    mask: str
+) -> Callable:
+    """
+    Generate the code of one evolution step, shared by all state layouts
+    
+    Radius-1 rules in _STEP_EXPRS use their Boolean expression, other
+    radius-1 rules OR together every (left, center, right) pattern mapped
+    to 1. Wider neighborhoods use the extended rule
+    ((rule ^ (value % 256)) >> (value % 8)) & 1, decoded into terms over
+    the 3 rightmost cells by _extended_rule_terms().
+    
+    Args:
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius (1, 2, 3, etc.)
+        params: Parameter list of the generated function
+        fetch: Returns the expression of the state shifted so cell i holds
+            cell i + offset
+        mask: Expression of the all-ones state
+    
+    Returns:
+        Generated step function
+    """
+    lines = [f"def step({params}):"]
+    rotations = {}
+    negations = set()
+    
+    def cell(offset: int, value: int) -> str:
+        """Name of the shifted state holding cell i + offset (negated if value 0)"""
+        if offset not in rotations:
+            name = f"x{len(rotations)}"
+            lines.append(f"    {name} = {fetch(offset)}")
+            rotations[offset] = name
+        if value:
+            return rotations[offset]
+        negations.add(rotations[offset])
+        return "n" + rotations[offset]
+    
+    terms = []
+    if radius == 1 and rule in _STEP_EXPRS:
+        names = {"L": cell(-1, 1), "C": cell(0, 1), "R": cell(1, 1)}
+        terms.append(re.sub(r"\b[LCR]\b", lambda m: names[m.group()], _STEP_EXPRS[rule]))
+    else:
+        if radius == 1:
+            offsets = (-1, 0, 1)
+            rule_terms = [(bits, None, True) for bits in _rule_patterns(rule)]
+        else:
+            offsets = (radius - 2, radius - 1, radius)
+            rule_terms = _extended_rule_terms(rule, radius)
         
-        return bytes(hash_bytes)
+        for bits, offset, invert in rule_terms:
+            factors = dict(zip(offsets, bits))
+            if offset is not None:
+                value = 0 if invert else 1
+                if factors.get(offset, value) != value:
+                    continue  # Cell must be both 0 and 1: never fires
+                factors[offset] = value
+            terms.append(" & ".join(cell(o, v) for o, v in factors.items()))
+    
+    lines.extend(f"    n{name} = {name} ^ {mask}" for name in sorted(negations))
+    lines.append("    return " + (" | ".join(f"({t})" for t in terms) if terms else "0"))
+    namespace = {}
+    exec(compile("\n".join(lines), f"<ca step rule={rule} radius={radius}>", "exec"), namespace)
+    return namespace["step"]
+
+
+@lru_cache(maxsize=None)
+def _rule_patterns(rule: int) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Decode a radius-1 rule into the (left, center, right) patterns mapped to 1
+    
+    Args:
+        rule: CA rule number (0-255)
+    
+    Returns:
+        Tuple of (left, center, right) bit patterns
+    """
+    return tuple(
+        ((pattern >> 2) & 1, (pattern >> 1) & 1, pattern & 1)
+        for pattern in range(8)
+        if (rule >> pattern) & 1
+    )
+
+
+@lru_cache(maxsize=None)
+def _extended_rule_terms(rule: int, radius: int) -> Tuple[Tuple[Tuple[int, int, int], Optional[int], bool], ...]:
+    """
+    Decode the radius > 1 extended rule into one term per 3-cell pattern
+    
+    Bit `pattern` of the neighborhood value is cell i + radius - pattern
+    (or 0 outside the 2*radius + 1 window), XORed with rule bit `pattern`.
+    Terms that can never produce a 1 are dropped.
+    
+    Args:
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius (> 1)
+    
+    Returns:
+        Tuple of (pattern bits, neighbor offset or None, invert) terms
+    """
+    terms = []
+    for pattern in range(8):
+        offset = radius - pattern if pattern <= 2 * radius else None
+        invert = bool((rule >> pattern) & 1)
+        if offset is None and not invert:
+            continue
+        bits = ((pattern >> 2) & 1, (pattern >> 1) & 1, pattern & 1)
+        terms.append((bits, offset, invert))
+    return tuple(terms)
+
+
+# Compiled kernels are cached on disk, except when this file runs as a
+# script: cache entries record the importing module name, and the package
+# entries ("hash.cellular_automaton") cannot be reloaded from __main__
+_KERNEL_CACHE = __name__ != "__main__"
+
+
+if njit is not None:
+    @njit(cache=_KERNEL_CACHE, boundscheck=False)
+    def _evolve_numba(state, rule, radius, steps):
+        """
+        Compiled evolution loop over one uint8 per cell
+        
+        Same rules as TrafficAdaptiveCA.evolve(); runs all steps in one call.
+        Each step copies the row into a wrap-around padded buffer once, then
+        slides a (2*radius + 1)-bit window over it, so nothing is allocated
+        per step.
+        
+        Args:
+            state: uint8 array of cells (0 or 1)
+            rule: CA rule number (0-255)
+            radius: Neighborhood radius
+            steps: Number of evolution steps
+        
+        Returns:
+            New uint8 array of cells
+        """
+        size = state.shape[0]
+        width = 2 * radius + 1
+        window = (1 << width) - 1
+        current = state.copy()
+        padded = np.empty(size + 2 * radius, dtype=np.uint8)
+        
+        for _ in range(steps):
+            padded[radius:radius + size] = current
+            for j in range(radius):
+                padded[j] = current[(j - radius) % size]
+                padded[radius + size + j] = current[j % size]
+            
+            neighborhood_value = 0
+            for j in range(width - 1):
+                neighborhood_value = (neighborhood_value << 1) | padded[j]
+            
+            for i in range(size):
+                neighborhood_value = ((neighborhood_value << 1) | padded[i + width - 1]) & window
+                if radius == 1:
+                    current[i] = (rule >> neighborhood_value) & 1
+                else:
+                    extended_rule = rule ^ (neighborhood_value % 256)
+                    current[i] = (extended_rule >> (neighborhood_value % 8)) & 1
+        
+        return current
+    
+    @njit(cache=_KERNEL_CACHE, parallel=True)
+    def _evolve_lanes_numba(lanes, rule, radius, steps):
+        """
+        Compiled, parallel evolution of bit-sliced replicas
+        
+        Same rules as TrafficAdaptiveCA.evolve(). lanes[c, i] holds cell i of
+        64 replicas (bit j = replica j) for chunk c; chunks run in parallel
+        with prange. Each chunk double-buffers between its row and one
+        wrap-around padded scratch buffer allocated once for all steps.
+        
+        Args:
+            lanes: 2-D uint64 array of shape (chunks, cells)
+            rule: CA rule number (0-255)
+            radius: Neighborhood radius
+            steps: Number of evolution steps
+        
+        Returns:
+            New 2-D uint64 array of lanes
+        """
+        size = lanes.shape[1]
+        width = 2 * radius + 1
+        all_lanes = np.uint64(0xFFFFFFFFFFFFFFFF)
+        result = lanes.copy()
+        
+        for chunk in prange(lanes.shape[0]):
+            current = result[chunk]
+            padded = np.empty(size + 2 * radius, dtype=np.uint64)
+            
+            for _ in range(steps):
+                padded[radius:radius + size] = current
+                for j in range(radius):
+                    padded[j] = current[size - radius + j]
+                    padded[radius + size + j] = current[j]
+                
+                for i in range(size):
+                    # The 3 rightmost cells of the neighborhood (left, center,
+                    # right for radius 1)
+                    a = padded[i + width - 3]
+                    b = padded[i + width - 2]
+                    c = padded[i + width - 1]
+                    not_a = a ^ all_lanes
+                    not_b = b ^ all_lanes
+                    not_c = c ^ all_lanes
+                    
+                    new_lanes = np.uint64(0)
+                    for pattern in range(8):
+                        rule_bit = (rule >> pattern) & 1
+                        if radius == 1:
+                            # Standard rule: pattern fires if its rule bit is set
+                            if rule_bit == 0:
+                                continue
+                            mixed = all_lanes
+                        else:
+                            # Extended rule: rule bit XOR neighborhood bit `pattern`
+                            if pattern <= 2 * radius:
+                                mixed = padded[i + width - 1 - pattern]
+                            else:
+                                mixed = np.uint64(0)
+                            if rule_bit:
+                                mixed = mixed ^ all_lanes
+                        new_lanes |= ((a if pattern & 4 else not_a)
+                                      & (b if pattern & 2 else not_b)
+                                      & (c if pattern & 1 else not_c)
+                                      & mixed)
+                    current[i] = new_lanes
+        
+        return result
+else:
+    _evolve_numba = None
+    _evolve_lanes_numba = None
+
+
+# GPU batch evolution, opt-in through use_gpu: one block per replica, one
+# thread per cell. Only checked under the CUDA simulator
+# (NUMBA_ENABLE_CUDASIM=1), bit for bit against the CPU paths.
+_CUDA_CELLS = 256
+_CUDA_MAX_RADIUS = 5
+
+
+if cuda is not None:
+    @cuda.jit(cache=_KERNEL_CACHE)
+    def _evolve_cuda_kernel(states, rule, radius, steps):
+        """
+        Evolve states[blockIdx.x] in shared memory, thread i owning cell i
+        
+        Same rules as TrafficAdaptiveCA.evolve(). Launch with one block of
+        _CUDA_CELLS threads per replica and radius <= _CUDA_MAX_RADIUS.
+        """
+        padded = cuda.shared.array(_CUDA_CELLS + 2 * _CUDA_MAX_RADIUS, dtype=np.uint8)
+        replica = cuda.blockIdx.x
+        i = cuda.threadIdx.x
+        
+        padded[radius + i] = states[replica, i]
+        
+        for _ in range(steps):
+            cuda.syncthreads()
+            if i < radius:
+                # Wrap-around halo on both sides
+                padded[i] = padded[_CUDA_CELLS + i]
+                padded[radius + _CUDA_CELLS + i] = padded[radius + i]
+            cuda.syncthreads()
+            
+            neighborhood_value = 0
+            for j in range(2 * radius + 1):
+                neighborhood_value = (neighborhood_value << 1) | int(padded[i + j])
+            
+            if radius == 1:
+                new_cell = (rule >> neighborhood_value) & 1
+            else:
+                extended_rule = rule ^ (neighborhood_value % 256)
+                new_cell = (extended_rule >> (neighborhood_value % 8)) & 1
+            
+            cuda.syncthreads()
+            padded[radius + i] = new_cell
+        
+        cuda.syncthreads()
+        states[replica, i] = padded[radius + i]
+else:
+    _evolve_cuda_kernel = None
+
+
+@lru_cache(maxsize=None)
+def _cuda_ready() -> bool:
+    """Whether the CUDA kernel can run (numba.cuda importable and a GPU present)"""
+    return _evolve_cuda_kernel is not None and cuda.is_available()
+
+
+def _evolve_batch_cuda(states, rule: int, radius: int, steps: int):
+    """
+    Evolve a 2-D uint8 array of replicas (shape (n, 256)) on the GPU
+    
+    Args:
+        states: One row of cells per replica
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius (<= _CUDA_MAX_RADIUS)
+        steps: Number of evolution steps
+    
+    Returns:
+        New 2-D uint8 array of cells
+    """
+    device_states = cuda.to_device(np.ascontiguousarray(states))
+    _evolve_cuda_kernel[states.shape[0], _CUDA_CELLS](device_states, rule, radius, steps)
+    return device_states.copy_to_host()
 
 
 def traffic_adaptive_hash(
@@ -273,11 +688,37 @@ def traffic_adaptive_hash(
     # Question 2.2 (Atelier 2): Convert text to bytes
     data = input_data.encode('utf-8')
     
+    return traffic_adaptive_hash_bytes(data, traffic_density, signal_state, urgency).hex()
+
+
+def traffic_adaptive_hash_bytes(
+    data: bytes,
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0,
+    pad_ctx=None
+) -> bytes:
+    """
+    Traffic-adaptive CA hash of raw bytes, returned as the raw digest
+    
+    Same hash as traffic_adaptive_hash() without the text encoding and hex
+    round trips; use it when the digest is compared or analyzed as bytes.
+    
+    Args:
+        data: Input data bytes
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+        pad_ctx: Optional hashlib.sha256 object that already absorbed `data`
+    
+    Returns:
+        32 bytes (256 bits) hash
+    """
     # Create CA instance
     ca = TrafficAdaptiveCA(size=256)
     
     # Initialize with traffic-aware seeding
-    ca.init_state(data, traffic_density)
+    ca.init_state(data, traffic_density, pad_ctx)
     
     # Select rule based on traffic conditions
     rule = ca.select_traffic_rule(traffic_density, signal_state)
@@ -289,13 +730,285 @@ def traffic_adaptive_hash(
     steps = ca.calculate_evolution_steps(traffic_density, urgency)
     
     # Evolve CA
-    for _ in range(steps):
-        ca.evolve(rule, radius)
+    ca.evolve_steps(rule, radius, steps)
     
     # Extract hash
-    hash_bytes = ca.get_hash(steps)
+    return ca.get_hash(steps)
+
+
+def traffic_adaptive_hash_stream(
+    prefix: bytes,
+    prefix_ctx,
+    nonce: int,
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0
+) -> str:
+    """
+    Hash `prefix + str(nonce)` reusing a SHA-256 context of the prefix
+    
+    Gives the same result as traffic_adaptive_hash(prefix + str(nonce), ...).
+    Meant for mining loops where only the nonce changes: the padding
+    digest continues from a copy of `prefix_ctx` instead of rehashing the
+    whole input for every nonce.
+    
+    Args:
+        prefix: UTF-8 encoded data before the nonce
+        prefix_ctx: hashlib.sha256(prefix), created once by the caller
+        nonce: Mining nonce
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+    
+    Returns:
+        256-bit hash as hexadecimal string (64 characters)
+    
+    Example:
+        prefix = b"block_12345|"
+        ctx = hashlib.sha256(prefix)
+        hashes = [traffic_adaptive_hash_stream(prefix, ctx, n, 0.2, "GREEN") for n in range(100)]
+    """
+    nonce_bytes = str(nonce).encode('utf-8')
+    data = prefix + nonce_bytes
+    
+    # The padding digest is only needed for inputs shorter than the state
+    pad_ctx = None
+    if len(data) < 32:
+        pad_ctx = prefix_ctx.copy()
+        pad_ctx.update(nonce_bytes)
+    
+    return traffic_adaptive_hash_bytes(data, traffic_density, signal_state, urgency, pad_ctx).hex()
+
+
+def traffic_adaptive_hash_batch(
+    inputs: List[str],
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0,
+    use_gpu: bool = False
+) -> List[str]:
+    """
+    Hash many inputs under the same traffic conditions
+    
+    Gives the same results as calling traffic_adaptive_hash() on each
+    input; see traffic_adaptive_hash_batch_bytes() for how the batch is
+    evolved.
+    
+    Args:
+        inputs: Data strings to hash
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+        use_gpu: Evolve on a CUDA GPU when one is available
+    
+    Returns:
+        List of 256-bit hashes as hexadecimal strings, in input order
+    """
+    digests = traffic_adaptive_hash_batch_bytes(
+        [x.encode('utf-8') for x in inputs], traffic_density, signal_state, urgency, use_gpu
+    )
+    return [digest.hex() for digest in digests]
+
+
+def traffic_adaptive_hash_batch_bytes(
+    inputs: List[bytes],
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0,
+    use_gpu: bool = False
+) -> List[bytes]:
+    """
+    Hash many raw inputs under the same traffic conditions, as raw digests
+    
+    Gives the same results as calling traffic_adaptive_hash_bytes() on each
+    input. The inputs share rule, radius and steps, so they are evolved together
+    64 at a time: each cell is a uint64 word whose bit j is that cell in
+    replica j, and one bitwise step advances all 64 replicas. With Numba
+    the chunks run compiled and in parallel across CPU cores, with numpy
+    only they run one after another. With `use_gpu` the batch runs on a
+    CUDA GPU (numba.cuda) instead, falling back to the CPU when none is
+    available. Without numpy inputs are hashed one at a time.
+    
+    Args:
+        inputs: Data bytes to hash
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+        use_gpu: Evolve on a CUDA GPU when one is available; only pays
+            off for large batches, which amortize the device transfers
+    
+    Returns:
+        List of 32-byte hashes, in input order
+    """
+    if np is None:
+        return [traffic_adaptive_hash_bytes(x, traffic_density, signal_state, urgency) for x in inputs]
+    
+    ca = TrafficAdaptiveCA(size=256)
+    rule = ca.select_traffic_rule(traffic_density, signal_state)
+    radius = ca.adapt_neighborhood(signal_state)
+    steps = ca.calculate_evolution_steps(traffic_density, urgency)
+    num_bytes = ca.size // 8
+    
+    # Initial states, one row of cells per replica; hashlib is needed for the
+    # padding so this part stays in Python
+    seeds = np.frombuffer(
+        b''.join(ca.seed_bytes(x, traffic_density) for x in inputs),
+        dtype=np.uint8
+    ).reshape(len(inputs), num_bytes)
+    cells = np.unpackbits(seeds, axis=1)
+    
+    if use_gpu and radius <= _CUDA_MAX_RADIUS and _cuda_ready():
+        cells = _evolve_batch_cuda(cells, rule, radius, steps)
+    else:
+        lanes = _to_lanes(cells)
+        if _evolve_lanes_numba is not None:
+            lanes = _evolve_lanes_numba(lanes, rule, radius, steps)
+        else:
+            for chunk in lanes:
+                _evolve_lanes_numpy(chunk, rule, radius, steps)
+        cells = _from_lanes(lanes)[:len(inputs)]
+    
+    # With 256 cells each packed row is the hash itself
+    digests = np.packbits(cells, axis=1).tobytes()
+    return [digests[j:j + num_bytes] for j in range(0, len(digests), num_bytes)]
+
+
+def preferred_batch_size() -> int:
+    """
+    Batch size for traffic_adaptive_hash_batch that keeps every CPU busy
+    
+    Batches are evolved in 64-replica lane chunks, one chunk per Numba
+    thread, so smaller batches leave threads idle.
+    
+    Returns:
+        64 * Numba threads (64 without Numba)
+    """
+    if _evolve_lanes_numba is None:
+        return 64
+    return 64 * get_num_threads()
+
+
+def _to_lanes(cells):
+    """
+    Transpose replica rows into bit-sliced lanes, 64 replicas per chunk
+    
+    Args:
+        cells: uint8 array (replicas, cells) of 0/1 values
+    
+    Returns:
+        uint64 array (chunks, cells): bit j of [c, i] = cell i of replica 64*c + j
+    """
+    replicas, size = cells.shape
+    chunks = (replicas + 63) // 64
+    rows = np.zeros((chunks * 64, size), dtype=np.uint8)
+    rows[:replicas] = cells
+    packed = np.packbits(rows.reshape(chunks, 64, size), axis=1, bitorder='little')
+    return np.ascontiguousarray(packed.transpose(0, 2, 1)).view('<u8').reshape(chunks, size)
+
+
+def _from_lanes(lanes):
+    """
+    Inverse of _to_lanes()
+    
+    Args:
+        lanes: uint64 array (chunks, cells)
+    
+    Returns:
+        uint8 array (chunks * 64, cells) of 0/1 values
+    """
+    chunks, size = lanes.shape
+    packed = lanes.astype('<u8').view(np.uint8).reshape(chunks, size, 8).transpose(0, 2, 1)
+    return np.unpackbits(packed, axis=1, bitorder='little').reshape(chunks * 64, size)
+
+
+def _evolve_lanes_numpy(lanes, rule: int, radius: int, steps: int) -> None:
+    """
+    Evolve one chunk of 64 bit-sliced replicas in place with numpy
+    
+    The lanes are copied into the center of a buffer with a wrap-around
+    halo once per step, so every neighbor is a view into that buffer
+    instead of a rolled copy.
+    
+    Args:
+        lanes: uint64 array of cells (bit j = replica j)
+        rule: CA rule number (0-255)
+        radius: Neighborhood radius
+        steps: Number of evolution steps
+    """
+    size = lanes.shape[0]
+    all_lanes = np.uint64(0xFFFFFFFFFFFFFFFF)
+    padded = np.empty(size + 2 * radius, dtype=np.uint64)
+    center = padded[radius:radius + size]
+    center[:] = lanes
+    step = _lane_step(rule, radius)
+    
+    def neighbor(offset: int):
+        """View of the lanes shifted so cell i holds cell i + offset"""
+        return padded[radius + offset:radius + offset + size]
+    
+    for _ in range(steps):
+        padded[:radius] = center[size - radius:]
+        padded[radius + size:] = center[:radius]
+        center[:] = step(neighbor, all_lanes)
     
-    return hash_bytes.hex()
+    lanes[:] = center
+
+
+def traffic_sha256_hash(
+    input_data: str,
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0
+) -> str:
+    """
+    SHA-256 variant of the traffic-adaptive hash, as hex
+    
+    Args:
+        input_data: Data to hash
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+    
+    Returns:
+        256-bit hash as hexadecimal string (64 characters)
+    """
+    return traffic_sha256_hash_bytes(input_data.encode('utf-8'), traffic_density, signal_state, urgency).hex()
+
+
+def traffic_sha256_hash_bytes(
+    data: bytes,
+    traffic_density: float = 0.5,
+    signal_state: str = "GREEN",
+    urgency: int = 0
+) -> bytes:
+    """
+    SHA-256 variant of the traffic-adaptive hash
+    
+    Keeps the traffic parameters as a prefix tweak and delegates bit mixing
+    to hashlib.sha256 (hardware-accelerated where the CPU supports it).
+    Heavier traffic still means more work: steps // 64 SHA-256 rounds in
+    total (1 round at the minimum 64 steps, 4 at the 256-step cap).
+    
+    Args:
+        data: Input data bytes
+        traffic_density: Current traffic density (0.0-1.0)
+        signal_state: Current signal state (RED/YELLOW/GREEN/EMERGENCY)
+        urgency: Urgency level (0-10, for emergency vehicles)
+    
+    Returns:
+        32 bytes (256 bits) hash
+    """
+    ca = TrafficAdaptiveCA(size=256)
+    steps = ca.calculate_evolution_steps(traffic_density, urgency)
+    density_byte = int(traffic_density * 255)
+    
+    tweak = f"{signal_state}|{density_byte}|{urgency}|{steps}|".encode('utf-8')
+    digest = hashlib.sha256(tweak + data).digest()
+    
+    for _ in range(1, steps // 64):
+        digest = hashlib.sha256(digest).digest()
+    
+    return digest
 
 
 def intersection_hash(
@@ -315,16 +1028,25 @@ def intersection_hash(
     - Vehicle counts per direction
     - Weather conditions
     
+    Every field reaches the CA state: the serialized record is folded into
+    the 256-bit seed (see _fold_record), so swapping two directions' signals
+    or counts changes the hash.
+    
     Args:
         intersection_id: Unique intersection identifier
-        timestamp: Unix timestamp
+        timestamp: Unix timestamp (whole number, -2**63 <= t < 2**63, or any
+            other float)
         signal_states: Dict of signal states per direction
-        vehicle_counts: Dict of vehicle counts per direction
+        vehicle_counts: Dict of vehicle counts per direction (whole numbers,
+            0 <= count < 2**32)
         weather_factor: Weather impact on flow (0.0-1.0, 1.0=clear)
     
     Returns:
         256-bit hash as hex string
     
+    Raises:
+        ValueError: If the timestamp or a vehicle count is out of range
+    
     Example:
         hash = intersection_hash(
             intersection_id="Main-1st",
@@ -349,14 +1071,27 @@ def intersection_hash(
     else:
         overall_state = "GREEN"
     
-    # Construct input data
-    input_data = f"{intersection_id}|{timestamp}|{signal_states}|{vehicle_counts}|{weather_factor}"
+    # Construct input data: fixed-width fields first, then one compact
+    # (signal code, count) record per direction in sorted order, then the
+    # variable-length names
+    directions = sorted(set(signal_states) | set(vehicle_counts))
+    input_data = _pack_timestamp(timestamp) + struct.pack('<dI', weather_factor, len(directions))
+    names = b""
+    for direction in directions:
+        signal_state = signal_states.get(direction)
+        code = SIGNAL_CODES.get(signal_state, 0xFF)
+        input_data += struct.pack('<B', code)
+        input_data += _pack_int('<I', vehicle_counts.get(direction, 0), f"vehicle count of {direction!r}")
+        names += _frame(direction)
+        if code == 0xFF:  # Unknown state: keep its name
+            names += _frame(str(signal_state))
+    input_data += names + _frame(intersection_id)
     
     # Calculate urgency (high vehicle count = high urgency)
     urgency = min(int(total_vehicles / 4), 10)
     
     # Generate hash
-    return traffic_adaptive_hash(input_data, adjusted_density, overall_state, urgency)
+    return traffic_adaptive_hash_bytes(_fold_record(input_data), adjusted_density, overall_state, urgency).hex()
 
 
 def block_hash_with_traffic(
@@ -383,16 +1118,76 @@ def block_hash_with_traffic(
         previous_hash: Hash of previous block
         timestamp: Block timestamp
         transactions: List of transactions
-        nonce: Mining nonce
+        nonce: Mining nonce (integer, 0 <= nonce < 2**64)
         network_congestion: Overall network traffic (0.0-1.0)
     
     Returns:
         Block hash as hex string
+    
+    Raises:
+        ValueError: If block_index or nonce is not a whole number in range
+    """
+    prefix_ctx = hashlib.sha256(block_prefix(block_index, previous_hash, timestamp, transactions))
+    return block_hash_mine(prefix_ctx, nonce, network_congestion).hex()
+
+
+def block_prefix(
+    block_index: int,
+    previous_hash: str,
+    timestamp: int,
+    transactions: list
+) -> bytes:
+    """
+    Serialize the nonce-independent part of a block header
+    
+    Fixed-width fields first, then the length-prefixed previous hash and
+    transactions. Build it once per block, absorb it into a SHA-256
+    context and hash candidate nonces with block_hash_mine().
+    
+    Args:
+        block_index: Block number (whole number, -2**63 <= index < 2**63)
+        previous_hash: Hash of previous block
+        timestamp: Block timestamp (whole number, -2**63 <= t < 2**63, or any
+            other float)
+        transactions: List of transactions
+    
+    Returns:
+        Encoded block fields, without the nonce
+    
+    Raises:
+        ValueError: If block_index or timestamp is out of range
+    """
+    tx_data = b"".join(_frame(str(tx)) for tx in transactions)
+    return (_pack_int('<q', block_index, "block_index") + _pack_timestamp(timestamp)
+            + struct.pack('<I', len(transactions))
+            + _frame(previous_hash) + tx_data)
+
+
+def block_hash_mine(prefix_ctx, nonce: int, network_congestion: float = 0.5) -> bytes:
     """
-    # Serialize block data
-    tx_data = "|".join([str(tx) for tx in transactions])
-    block_data = f"{block_index}|{previous_hash}|{timestamp}|{tx_data}|{nonce}"
+    Hash a pre-encoded block prefix with a candidate nonce
     
+    Same hash as block_hash_with_traffic() for the block the prefix was
+    built from, as the raw digest. The prefix is absorbed into `prefix_ctx` once; each call
+    copies that context and feeds it only the 8-byte nonce, so the cost
+    per nonce does not grow with the number of transactions. The digest
+    of prefix + nonce seeds the CA, so every nonce gives its own hash.
+    
+    Args:
+        prefix_ctx: hashlib.sha256(block_prefix(...)), created once per block
+        nonce: Mining nonce (integer, 0 <= nonce < 2**64)
+        network_congestion: Overall network traffic (0.0-1.0)
+    
+    Returns:
+        32-byte block hash
+    
+    Raises:
+        ValueError: If nonce is not a whole number in range
+    
+    Example:
+        ctx = hashlib.sha256(block_prefix(1, prev_hash, ts, txs))
+        hashes = [block_hash_mine(ctx, n, 0.4) for n in range(1000)]
+    """
     # Determine signal state based on congestion
     if network_congestion < 0.3:
         state = "GREEN"
@@ -404,7 +1199,87 @@ def block_hash_with_traffic(
     # Higher congestion = higher urgency (harder mining)
     urgency = int(network_congestion * 10)
     
-    return traffic_adaptive_hash(block_data, network_congestion, state, urgency)
+    # Same fold as _fold_record(prefix + nonce), without rehashing the prefix
+    record = prefix_ctx.copy()
+    record.update(_pack_int('<Q', nonce, "nonce"))
+    return traffic_adaptive_hash_bytes(record.digest(), network_congestion, state, urgency)
+
+
+def _frame(text: str) -> bytes:
+    """
+    Length-prefixed UTF-8 encoding, so concatenated fields stay unambiguous
+    
+    Args:
+        text: String field
+    
+    Returns:
+        4-byte little-endian length followed by the UTF-8 bytes
+    """
+    data = text.encode('utf-8')
+    return struct.pack('<I', len(data)) + data
+
+
+def _pack_int(fmt: str, value, field: str) -> bytes:
+    """
+    Pack a whole-number field (ints, or floats with no fractional part)
+    
+    Args:
+        fmt: struct format of the field, e.g. '<I'
+        value: Field value
+        field: Field name for the error message
+    
+    Returns:
+        Packed field
+    
+    Raises:
+        ValueError: If value is not a whole number or does not fit the format
+    """
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    try:
+        return struct.pack(fmt, value)
+    except struct.error:
+        raise ValueError(f"{field} must be a whole number that fits '{fmt}', got {value!r}") from None
+
+
+def _pack_timestamp(value) -> bytes:
+    """
+    Pack a timestamp exactly, tagged by kind
+    
+    Whole numbers (including floats with no fractional part) are packed as
+    a signed 64-bit int after a 0 tag byte, so nanosecond timestamps above
+    2**53 stay distinct. Other floats are packed as a float64 after a 1 tag
+    byte.
+    
+    Args:
+        value: Timestamp (int or float)
+    
+    Returns:
+        9-byte encoded timestamp
+    
+    Raises:
+        ValueError: If a whole-number timestamp does not fit in 64 bits
+    """
+    if isinstance(value, float) and not value.is_integer():
+        return struct.pack('<Bd', 1, value)
+    return struct.pack('<B', 0) + _pack_int('<q', value, "timestamp")
+
+
+def _fold_record(data: bytes) -> bytes:
+    """
+    Fold a serialized record into the 256-bit CA seed
+    
+    The CA is seeded with the first 32 bytes of its input only, so the
+    record is compressed with SHA-256 first; otherwise fields past byte 32
+    would not affect the hash.
+    
+    Args:
+        data: Serialized record
+    
+    Returns:
+        32 bytes covering the whole record
+    """
+    return hashlib.sha256(data).digest()
 
 
 def verify_different_inputs() -> bool:
@@ -417,13 +1292,13 @@ def verify_different_inputs() -> bool:
     input1 = "intersection_Main_1st_signal_GREEN"
     input2 = "intersection_Main_1st_signal_RED"
     
-    hash1 = traffic_adaptive_hash(input1, 0.5, "GREEN")
-    hash2 = traffic_adaptive_hash(input2, 0.5, "RED")
+    hash1 = traffic_adaptive_hash_bytes(input1.encode('utf-8'), 0.5, "GREEN")
+    hash2 = traffic_adaptive_hash_bytes(input2.encode('utf-8'), 0.5, "RED")
     
     print(f"Input 1: {input1}")
-    print(f"Hash 1:  {hash1}")
+    print(f"Hash 1:  {hash1.hex()}")
     print(f"\nInput 2: {input2}")
-    print(f"Hash 2:  {hash2}")
+    print(f"Hash 2:  {hash2.hex()}")
     print(f"\nHashes different: {hash1 != hash2}")
     
     return hash1 != hash2
@@ -5,7 +5,8 @@ Questions 4, 5, 6, 7, 11 from Atelier 2
 
 import time
 import hashlib
-from typing import Dict, List, Tuple, Callable
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Callable
 from . import cellular_automaton as ca
 
 
@@ -40,7 +41,7 @@ def avalanche_test(hash_func: Callable, input_data: str) -> float:
     Good hash functions should have ~50% avalanche effect.
     
     Args:
-        hash_func: Hash function to test
+        hash_func: Hash function to test (returns digest bytes)
         input_data: Input data string
     
     Returns:
@@ -57,47 +58,48 @@ def avalanche_test(hash_func: Callable, input_data: str) -> float:
     # Modified hash
     hash2 = hash_func(data_bytes.decode('utf-8', errors='ignore'))
     
-    # Count different bits
-    different_bits = 0
-    total_bits = len(hash1) * 4  # Each hex char = 4 bits
-    
-    for i in range(len(hash1)):
-        h1_nibble = int(hash1[i], 16)
-        h2_nibble = int(hash2[i], 16)
-        xor = h1_nibble ^ h2_nibble
-        
-        # Count set bits in XOR
-        different_bits += bin(xor).count('1')
+    # Count different bits (set bits in the XOR of both hashes)
+    total_bits = len(hash1) * 8
+    different_bits = (int.from_bytes(hash1, 'big') ^ int.from_bytes(hash2, 'big')).bit_count()
     
     percentage = (different_bits / total_bits) * 100
     return percentage
 
 
-def bit_distribution_test(hash_func: Callable, num_samples: int = 1000) -> float:
+def bit_distribution_test(
+    hash_func: Callable,
+    num_samples: int = 1000,
+    inputs: Optional[List[str]] = None,
+    batch_func: Optional[Callable[[List[str]], List[bytes]]] = None
+) -> float:
     """
     Question 6 (Atelier 2): Analyze bit distribution
     
     Good hash functions should produce approximately 50% ones and 50% zeros.
     
     Args:
-        hash_func: Hash function to test
+        hash_func: Hash function to test (returns digest bytes)
         num_samples: Number of hash samples to analyze
+        inputs: Optional prebuilt corpus to hash instead of the
+            `num_samples` generated test inputs (lets callers share it)
+        batch_func: Optional batch version of hash_func (list in, list out),
+            used to hash the whole corpus in one call
     
     Returns:
         Percentage of '1' bits (should be ~50% for good hash)
     """
-    total_ones = 0
-    total_bits = 0
+    if inputs is None:
+        inputs = [f"test_input_{i}" for i in range(num_samples)]
     
-    for i in range(num_samples):
-        hash_result = hash_func(f"test_input_{i}")
-        
-        # Convert hex to binary and count 1s
-        hash_int = int(hash_result, 16)
-        ones_count = bin(hash_int).count('1')
-        
-        total_ones += ones_count
-        total_bits += 256  # 256-bit hash
+    if batch_func is not None:
+        hash_results = batch_func(inputs)
+    else:
+        hash_results = [hash_func(x) for x in inputs]
+    
+    # Count 1s over all digests at once
+    digests = b"".join(hash_results)
+    total_ones = int.from_bytes(digests, 'big').bit_count()
+    total_bits = 256 * len(inputs)  # 256-bit hash
     
     percentage_ones = (total_ones / total_bits) * 100
     return percentage_ones
@@ -118,35 +120,53 @@ def compare_rules(input_data: str = "test_blockchain_data") -> Dict:
     Returns:
         Dictionary with comparison results
     """
-    # Define hash functions to compare
+    # Define hash functions to compare, as (single hash, batch hash):
+    # CA hashes score the bit distribution corpus in one batch
     hash_functions = {
-        'SHA-256': lambda x: hashlib.sha256(x.encode()).hexdigest(),
-        'Rule 30 (LOW/GREEN)': lambda x: ca.traffic_adaptive_hash(x, 0.2, "GREEN", 0),
-        'Rule 90 (MED/YELLOW)': lambda x: ca.traffic_adaptive_hash(x, 0.5, "YELLOW", 0),
-        'Rule 110 (HIGH/RED)': lambda x: ca.traffic_adaptive_hash(x, 0.9, "RED", 0),
-        'Rule 184 (EMERGENCY)': lambda x: ca.traffic_adaptive_hash(x, 0.5, "EMERGENCY", 10),
+        'SHA-256': (lambda x: hashlib.sha256(x.encode()).digest(), None),
+        'Rule 30 (LOW/GREEN)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.2, "GREEN", 0),
+                                lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.2, "GREEN", 0)),
+        'Rule 90 (MED/YELLOW)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.5, "YELLOW", 0),
+                                 lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.5, "YELLOW", 0)),
+        'Rule 110 (HIGH/RED)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.9, "RED", 0),
+                                lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.9, "RED", 0)),
+        'Rule 184 (EMERGENCY)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.5, "EMERGENCY", 10),
+                                 lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.5, "EMERGENCY", 10)),
+        'SHA-256 (traffic)': (lambda x: ca.traffic_sha256_hash_bytes(x.encode(), 0.5, "EMERGENCY", 10), None),
     }
     
+    # Bit distribution corpus, shared by all hash functions
+    corpus = [f"test_input_{i}" for i in range(100)]
+    
     results = {}
     
     print("\n" + "=" * 80)
     print("HASH FUNCTION COMPARISON")
     print("=" * 80)
     
-    for rule_name, hash_func in hash_functions.items():
+    for rule_name, (hash_func, batch_func) in hash_functions.items():
         print(f"\nTesting {rule_name}...")
         
+        # The warm-up, the avalanche test and the sample hash all hash
+        # input_data, so they share one cached result; the benchmark and the
+        # corpus only see distinct inputs and use the plain function
+        cached_hash = lru_cache(maxsize=None)(hash_func)
+        
+        # Untimed first call: compiles the Numba kernel / specialized step
+        # for this rule so the benchmark measures hashing only
+        cached_hash(input_data)
+        
         # Benchmark (Question 4.1)
         avg_time = benchmark_hash(hash_func, input_data, iterations=100)
         
         # Avalanche effect (Question 5)
-        avalanche = avalanche_test(hash_func, input_data)
+        avalanche = avalanche_test(cached_hash, input_data)
         
         # Bit distribution (Question 6)
-        bit_dist = bit_distribution_test(hash_func, num_samples=100)
+        bit_dist = bit_distribution_test(hash_func, inputs=corpus, batch_func=batch_func)
         
         # Sample hash
-        sample_hash = hash_func(input_data)
+        sample_hash = cached_hash(input_data).hex()
         
         results[rule_name] = {
             'avg_time_ms': round(avg_time, 4),
@@ -164,34 +184,100 @@ def compare_rules(input_data: str = "test_blockchain_data") -> Dict:
     return results
 
 
+# Block mined by the mining simulations: index, previous hash, timestamp,
+# transactions
+_MINING_BLOCK = (1, "0" * 64, 1234567890, ["transactions_data"])
+
+
 def mining_simulation(
-    hash_func: Callable,
+    hash_func: Callable[[str], bytes],
     difficulty: int = 4,
-    max_nonce: int = 100000
+    max_nonce: int = 100000,
+    batch_func: Optional[Callable[[List[str]], List[bytes]]] = None,
+    batch_size: Optional[int] = None
 ) -> Tuple[int, float]:
     """
     Question 4.2 (Atelier 2): Simulate mining with difficulty target
     
     Simulates proof-of-work mining by finding a hash with N leading zeros.
+    Each try hashes the mining block written out as text, followed by the
+    nonce.
+    
+    Args:
+        hash_func: Hash function to use for mining (returns digest bytes)
+        difficulty: Number of leading zero hex digits required
+        max_nonce: Maximum nonce to try before giving up
+        batch_func: Optional batch version of hash_func (list in, list out);
+            nonces are then tried `batch_size` at a time
+        batch_size: Number of nonces per batch_func call (default:
+            ca.preferred_batch_size(), one lane chunk per Numba thread)
+    
+    Returns:
+        Tuple of (iterations_needed, time_taken_ms)
+        Returns (-1, -1) if not found within max_nonce
+    """
+    block_index, previous_hash, timestamp, transactions = _MINING_BLOCK
+    block_data = f"block_{block_index}_{previous_hash}_{timestamp}_" + "_".join(transactions)
+    
+    if batch_func is None:
+        nonce_hashes = ((nonce, hash_func(block_data + str(nonce))) for nonce in range(max_nonce))
+    else:
+        nonce_hashes = _batch_nonce_hashes(batch_func, block_data, max_nonce,
+                                           batch_size or ca.preferred_batch_size())
+    
+    return _search_nonce(nonce_hashes, difficulty)
+
+
+def block_mining_simulation(
+    mine_func: Callable[[Any, int], bytes],
+    difficulty: int = 4,
+    max_nonce: int = 100000
+) -> Tuple[int, float]:
+    """
+    Question 4.2 (Atelier 2): Simulate mining a block header
+    
+    Same search as mining_simulation() over the same block, encoded with
+    ca.block_prefix() and absorbed into a SHA-256 context once; only the
+    nonce changes per try.
     
     Args:
-        hash_func: Hash function to use for mining
-        difficulty: Number of leading zeros required
+        mine_func: Block hash over (prefix context, nonce), such as
+            ca.block_hash_mine
+        difficulty: Number of leading zero hex digits required
         max_nonce: Maximum nonce to try before giving up
     
     Returns:
         Tuple of (iterations_needed, time_taken_ms)
         Returns (-1, -1) if not found within max_nonce
     """
-    target_prefix = '0' * difficulty
-    block_data = "block_timestamp_1234567890_transactions_data"
+    prefix_ctx = hashlib.sha256(ca.block_prefix(*_MINING_BLOCK))
+    nonce_hashes = ((nonce, mine_func(prefix_ctx, nonce)) for nonce in range(max_nonce))
+    return _search_nonce(nonce_hashes, difficulty)
+
+
+def _batch_nonce_hashes(
+    batch_func: Callable[[List[str]], List[bytes]],
+    block_data: str,
+    max_nonce: int,
+    batch_size: int
+) -> Iterator[Tuple[int, bytes]]:
+    """(nonce, hash) pairs of block_data + nonce, `batch_size` nonces per batch_func call"""
+    for first_nonce in range(0, max_nonce, batch_size):
+        nonces = range(first_nonce, min(first_nonce + batch_size, max_nonce))
+        yield from zip(nonces, batch_func([block_data + str(nonce) for nonce in nonces]))
+
+
+def _search_nonce(nonce_hashes: Iterable[Tuple[int, bytes]], difficulty: int) -> Tuple[int, float]:
+    """
+    First nonce whose hash meets the difficulty, and the time spent hashing
     
+    Returns:
+        Tuple of (nonce, time_taken_ms), or (-1, -1) if none does
+    """
     start = time.time()
     
-    for nonce in range(max_nonce):
-        hash_result = hash_func(block_data + str(nonce))
-        
-        if hash_result.startswith(target_prefix):
+    for nonce, digest in nonce_hashes:
+        if _meets_difficulty(digest, difficulty):
             end = time.time()
             time_ms = (end - start) * 1000
             return nonce, time_ms
@@ -199,6 +285,20 @@ def mining_simulation(
     return -1, -1  # Not found
 
 
+def _meets_difficulty(digest: bytes, difficulty: int) -> bool:
+    """
+    Whether a digest starts with `difficulty` zero hex digits
+    
+    Checked directly on the leading (difficulty + 1) // 2 bytes, without
+    hex encoding.
+    """
+    full_bytes, half_byte = divmod(difficulty, 2)
+    prefix = digest[:full_bytes + half_byte]
+    if len(prefix) < full_bytes + half_byte:
+        return False
+    return int.from_bytes(prefix, 'big') >> (4 * half_byte) == 0
+
+
 def generate_full_report(output_file: str = "hash_analysis_report.txt"):
     """
     Question 11 (Atelier 2): Generate comprehensive analysis report
@@ -237,14 +337,27 @@ def generate_full_report(output_file: str = "hash_analysis_report.txt"):
         f.write(f"{'Hash Function':<25} {'Iterations':<15} {'Time (ms)':<15}\n")
         f.write("-" * 80 + "\n")
         
+        # (single hash, batch hash): CA hashes mine a batch of nonces per
+        # call (one 64-nonce lane chunk per Numba thread)
         hash_funcs = {
-            'SHA-256': lambda x: hashlib.sha256(x.encode()).hexdigest(),
-            'CA Hash (LOW)': lambda x: ca.traffic_adaptive_hash(x, 0.2, "GREEN", 0),
-            'CA Hash (HIGH)': lambda x: ca.traffic_adaptive_hash(x, 0.9, "RED", 0),
+            'SHA-256': (lambda x: hashlib.sha256(x.encode()).digest(), None),
+            'CA Hash (LOW)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.2, "GREEN", 0),
+                              lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.2, "GREEN", 0)),
+            'CA Hash (HIGH)': (lambda x: ca.traffic_adaptive_hash_bytes(x.encode(), 0.9, "RED", 0),
+                               lambda xs: ca.traffic_adaptive_hash_batch_bytes([x.encode() for x in xs], 0.9, "RED", 0)),
         }
         
-        for name, func in hash_funcs.items():
-            iterations, time_ms = mining_simulation(func, difficulty=4, max_nonce=50000)
+        mining_results = {
+            name: mining_simulation(func, difficulty=4, max_nonce=50000, batch_func=batch_func)
+            for name, (func, batch_func) in hash_funcs.items()
+        }
+        
+        # Same block mined as an encoded header with block_hash_mine
+        mining_results['CA Block (LOW)'] = block_mining_simulation(
+            lambda ctx, nonce: ca.block_hash_mine(ctx, nonce, 0.2), difficulty=4, max_nonce=50000
+        )
+        
+        for name, (iterations, time_ms) in mining_results.items():
             if iterations != -1:
                 f.write(f"{name:<25} {iterations:<15} {time_ms:<15.2f}\n")
             else:
@@ -3,11 +3,14 @@
 Quick Test - Traffic-Adaptive CA Hash Functions
 """
 
+import hashlib
 import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from hash.cellular_automaton import traffic_adaptive_hash
+from hash import cellular_automaton
+from hash.cellular_automaton import (traffic_adaptive_hash, traffic_adaptive_hash_batch,
+                                     block_prefix, block_hash_mine)
 
 print("=" * 70)
 print("TRAFFIC-ADAPTIVE CA HASH FUNCTION - QUICK TEST")
@@ -37,9 +40,53 @@ hash4 = traffic_adaptive_hash(test_data, 0.5, "EMERGENCY", 10)
 print(f"4. EMERGENCY:")
 print(f"   {hash4}\n")
 
+# Known answers: digests of the original implementation, so faster
+# evolution paths must reproduce them bit for bit
+KNOWN_HASHES = [
+    "b976293426d06f96b423f33999b5e1569af2a3b224736909b099d772040280d3",
+    "36333f5eb986df86b367acd678cf60347eb31eb319e31ff0cc68da33d9bd733f",
+    "d30076000000362fc17c03d30cbfd839978076a59b6a0d80ec9998ccc01b0cc3",
+    "02000904011010004108111010402056104020208004011020102aac02004440",
+]
+
+# Batch hashing must match one-at-a-time hashing, on every evolution path
+conditions = [(0.2, "GREEN", 0), (0.5, "YELLOW", 0), (0.9, "RED", 0), (0.5, "EMERGENCY", 10)]
+inputs = [f"test_input_{i}" for i in range(100)] + ["", test_data, "z" * 40]
+expected = {c: [traffic_adaptive_hash(x, *c) for x in inputs] for c in conditions}
+
+batch_matches = all(traffic_adaptive_hash_batch(inputs, *c) == expected[c] for c in conditions)
+
+# Same batch without the compiled kernels (numpy lanes / pure Python)
+saved = cellular_automaton._evolve_numba, cellular_automaton._evolve_lanes_numba
+cellular_automaton._evolve_numba = cellular_automaton._evolve_lanes_numba = None
+try:
+    fallback_matches = all(traffic_adaptive_hash_batch(inputs, *c) == expected[c] for c in conditions)
+    fallback_single = [traffic_adaptive_hash(test_data, *c) for c in conditions] == KNOWN_HASHES
+finally:
+    cellular_automaton._evolve_numba, cellular_automaton._evolve_lanes_numba = saved
+
+# Mining: every nonce of a block must give its own hash
+prefix_ctx = hashlib.sha256(block_prefix(12345, "000abc", 1699800000, ["tx1", "tx2", "tx3"]))
+block_hashes = [block_hash_mine(prefix_ctx, nonce, 0.8) for nonce in range(100)]
+
+checks = {
+    "All hashes are 256-bit": all(len(h) == 64 for h in [hash1, hash2, hash3, hash4]),
+    "All hashes are unique": len(set([hash1, hash2, hash3, hash4])) == 4,
+    "Hashes match known answers": [hash1, hash2, hash3, hash4] == KNOWN_HASHES,
+    "Hashes match known answers (no Numba)": fallback_single,
+    "Batch matches single hashes": batch_matches,
+    "Batch matches single hashes (no Numba)": fallback_matches,
+    "Block nonces give distinct hashes": len(set(block_hashes)) == len(block_hashes),
+}
+
 print("=" * 70)
 print("✓ ALL HASHES GENERATED SUCCESSFULLY")
 print("=" * 70)
-print(f"✓ All hashes are 256-bit: {all(len(h) == 64 for h in [hash1, hash2, hash3, hash4])}")
-print(f"✓ All hashes are unique: {len(set([hash1, hash2, hash3, hash4])) == 4}")
+for name, passed in checks.items():
+    print(f"{'✓' if passed else '✗'} {name}: {passed}")
+
+if not all(checks.values()):
+    print("\nHash function regression detected! ✗")
+    sys.exit(1)
+
 print("\nHash function is working correctly! ✨")